@@ -8,7 +8,7 @@ import discord
 
 from .config import load_config
 from .git import align_tag_version, get_version_hash
-from .playerdata import PlayerData
+from .playerdata import PlayerData, Player
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +22,9 @@ class MainBot(commands.Bot):
         if not Path("data").exists():
             Path("data").mkdir()
 
+    async def setup_hook(self):
+        await self.player_data.load()
+
     async def load_cogs(self):
         cogs_dir = Path(__file__).parent.joinpath("cogs")
         if cogs_dir.is_dir():
@@ -63,5 +66,10 @@ class MainBot(commands.Bot):
         embed.set_footer(text=f"Version: {await get_version_hash(self)}")
         await self.config.discord.bot_channel.send(embed=embed)
 
+    async def close(self):
+        await self.player_data.flush()
+        await Player.close_session()
+        await super().close()
+
     async def on_disconnect(self):
         logger.info("Bot disconnected.")
@@ -124,7 +124,7 @@ class MC(commands.Cog):
         """
         embed = MCEmbed(title=f"Who is {user.display_name} in Minecraft?")
         try:
-            player_data = self.bot.player_data.get(str(user.id))
+            player_data = self.bot.player_data.get(user.id)
         except ValueError:
             embed.description = "I don't have any data for this user."
             await interaction.response.send_message(embed=embed, ephemeral=True)
@@ -142,7 +142,7 @@ class MC(commands.Cog):
         """
         embed = MCEmbed(title="Your Player Profile")
         try:
-            player_data = self.bot.player_data.get(str(interaction.user.id))
+            player_data = self.bot.player_data.get(interaction.user.id)
         except ValueError:
             embed.description = "You are not in the player data. Ask a staff member to add you."
             await interaction.response.send_message(embed=embed, ephemeral=True)
@@ -171,13 +171,12 @@ class Players(commands.Cog):
     @players.command(name="list", description="List all known players on the Minecraft server.")
     async def list(self, interaction: discord.Interaction) -> None:
         embed = PlayersEmbed(title="All Known Players")
-        players = self.bot.player_data.get_all()
+        players = [f"{self.bot.get_user(discord_id).mention} ({player.mc_username})"
+                   for discord_id, player in self.bot.player_data.get_all()]
         if len(players) == 0:
             embed = PlayersEmbed(title="No players found.")
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
-        players = [f"{self.bot.get_user(discord_id).mention} ({player.mc_username})"
-                   for discord_id, player in players]
         logger.debug("Players: %s", players)
         view = PageView(players, embed)
         await view.build_embed()
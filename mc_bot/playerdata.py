@@ -1,11 +1,23 @@
+from collections import OrderedDict, defaultdict
 from pathlib import Path
 from uuid import UUID
-from typing import Union
+from typing import Iterator, Union
+import asyncio
 import json
 import logging
+import mmap
+import os
+import time
 
-import aiofiles
 import aiohttp
+try:
+    import orjson
+except ImportError:  # orjson is faster, but the standard library is good enough
+    orjson = None
+try:
+    import ijson
+except ImportError:  # only needed to stream very large player data files
+    ijson = None
 
 from .mcrcon import (
     team_join, team_leave, op, deop, whitelist_add, whitelist_remove,
@@ -18,15 +30,109 @@ import discord
 logger = logging.getLogger(__name__)
 
 
+def _dumps(data: dict) -> bytes:
+    # compact output, the files are only ever read by the bot
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode("utf-8")
+
+
+def _loads(data: bytes) -> dict:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+STREAM_THRESHOLD = 1024 * 1024  # bytes, below this a single parse beats streaming
+MMAP_THRESHOLD = 256 * 1024  # bytes, below this mapping the file costs more than reading it
+SAVE_DELAY = 0.1  # seconds to wait for further changes before writing the player data
+LOOKUP_TIMEOUT = 5  # seconds
+LOOKUP_CACHE_SIZE = 1024
+LOOKUP_CACHE_TTL = 24 * 60 * 60  # seconds, usernames can change hands
+# in-flight and completed lookups with the time they started, keyed by lowercased query, least recently used first
+_lookup_cache: OrderedDict[str, tuple[asyncio.Task['Player | None'], float]] = OrderedDict()
+
+
+def _read_json_file(path: Path) -> dict:
+    """Read a JSON object from a file, avoiding a copy of the raw bytes once the file is large enough to matter."""
+    size = path.stat().st_size
+    if ijson is not None and size > STREAM_THRESHOLD:
+        with open(path, 'rb') as f:
+            return dict(ijson.kvitems(f, ''))
+    if orjson is not None and size > MMAP_THRESHOLD:  # the json module can't parse a memoryview
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:  # must be released before the map is closed
+                return orjson.loads(view)
+    return _loads(path.read_bytes())
+
+
+class _UUIDCache:
+    """Successful lookups kept between restarts, keyed by lowercased query. Saved alongside the player data."""
+    def __init__(self) -> None:
+        self.entries: dict[str, tuple[UUID, str, float]] = {}  # uuid, username, and the time of the lookup
+        self.dirty = False
+
+    def load(self, data: bytes) -> None:
+        now = time.time()
+        # parse each UUID once here rather than on every cache hit
+        self.entries = {k: (UUID(v[0]), v[1], v[2]) for k, v in _loads(data).items() if now - v[2] <= LOOKUP_CACHE_TTL}
+
+    def dump(self) -> bytes:
+        now = time.time()
+        self.entries = {k: v for k, v in self.entries.items() if now - v[2] <= LOOKUP_CACHE_TTL}
+        self.dirty = False
+        return _dumps({k: (str(v[0]), v[1], v[2]) for k, v in self.entries.items()})
+
+    def get(self, key: str) -> tuple[UUID, str] | None:
+        entry = self.entries.get(key)
+        if entry is None or time.time() - entry[2] > LOOKUP_CACHE_TTL:
+            return None
+        return entry[0], entry[1]
+
+    def put(self, key: str, uuid: UUID, username: str) -> None:
+        self.entries[key] = (uuid, username, time.time())
+        self.dirty = True
+
+
+_uuid_cache = _UUIDCache()
+
+
+FLAG_TRUSTED = 1
+FLAG_WHITELISTED = 2
+FLAG_OWNER = 4
+FLAG_STAFF = 8
+_FLAGS = {"is_trusted": FLAG_TRUSTED, "is_whitelisted": FLAG_WHITELISTED, "is_owner": FLAG_OWNER,
+          "is_staff": FLAG_STAFF}
+
+
+def _flag_property(flag: int) -> property:
+    """Expose one bit of Player.flags as a boolean attribute."""
+    def getter(self: 'Player') -> bool:
+        return bool(self.flags & flag)
+
+    def setter(self: 'Player', value: bool) -> None:
+        if value:
+            self.flags |= flag
+        else:
+            self.flags &= ~flag
+    return property(getter, setter)
+
+
 class Player:
+    __slots__ = ("uuid", "mc_username", "flags")
+    _session: aiohttp.ClientSession | None = None  # shared by all lookups, see _get_session
+
+    is_trusted = _flag_property(FLAG_TRUSTED)
+    is_whitelisted = _flag_property(FLAG_WHITELISTED)
+    is_owner = _flag_property(FLAG_OWNER)
+    is_staff = _flag_property(FLAG_STAFF)
+
     def __init__(self, uuid: UUID, mc_username: str, is_trusted: bool = False, is_whitelisted: bool = False,
                  is_owner: bool = False, is_staff: bool = False) -> None:
         self.uuid = uuid
         self.mc_username = mc_username
-        self.is_trusted = is_trusted
-        self.is_whitelisted = is_whitelisted
-        self.is_owner = is_owner
-        self.is_staff = is_staff
+        self.flags = ((FLAG_TRUSTED if is_trusted else 0) | (FLAG_WHITELISTED if is_whitelisted else 0)
+                      | (FLAG_OWNER if is_owner else 0) | (FLAG_STAFF if is_staff else 0))
 
     def __repr__(self):
         return f"Player(uuid={self.uuid}, mc_username={self.mc_username}, is_trusted={self.is_trusted},\
@@ -36,8 +142,10 @@ is_whitelisted={self.is_whitelisted})"
         return f"{self.mc_username} ({self.uuid})"
 
     def as_dict(self):
-        return {"uuid": str(self.uuid), "mc_username": self.mc_username, "is_trusted": self.is_trusted,
-                "is_whitelisted": self.is_whitelisted, "is_owner": self.is_owner, "is_staff": self.is_staff}
+        flags = self.flags
+        return {"uuid": str(self.uuid), "mc_username": self.mc_username,
+                "is_trusted": bool(flags & FLAG_TRUSTED), "is_whitelisted": bool(flags & FLAG_WHITELISTED),
+                "is_owner": bool(flags & FLAG_OWNER), "is_staff": bool(flags & FLAG_STAFF)}
 
     @classmethod
     def from_dict(cls, data: dict[str, str]) -> Union['Player', None]:
@@ -49,19 +157,96 @@ is_whitelisted={self.is_whitelisted})"
 
     @classmethod
     async def lookup_player(cls, query: str) -> Union['Player', None]:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f'https://playerdb.co/api/player/minecraft/{query}') as resp:
-                if resp.status == 204:
-                    return None
-                data = await resp.json()
-                if data['success'] is False:
-                    return None
+        """Look up a player on playerdb.co. Concurrent and repeated lookups for the same name share one request.
 
-                # https://playerdb.co/api/player/minecraft/EmberIgnited
-                uuid = UUID(data['data']['player']['id'])
-                username = data['data']['player']['username']
+        Args:
+            query (str): The Minecraft username or UUID to look up.
 
-                return cls(uuid, username)
+        Returns:
+            Player | None: A new player object if found, otherwise None.
+        """
+        key = query.lower()
+        entry = _lookup_cache.get(key)
+        if entry is not None and time.monotonic() - entry[1] > LOOKUP_CACHE_TTL:
+            del _lookup_cache[key]
+            entry = None
+        if entry is None:
+            # a task of its own, so cancelling the first caller can't leave the other waiters hanging
+            task = asyncio.create_task(cls._resolve_player(key, query))
+            _lookup_cache[key] = (task, time.monotonic())
+            if len(_lookup_cache) > LOOKUP_CACHE_SIZE:
+                _lookup_cache.popitem(last=False)
+        else:
+            task = entry[0]
+            _lookup_cache.move_to_end(key)
+        player = await asyncio.shield(task)
+        if player is None:
+            return None
+        return cls(player.uuid, player.mc_username)  # callers mutate the player, don't hand out the cached one
+
+    @classmethod
+    async def _resolve_player(cls, key: str, query: str) -> Union['Player', None]:
+        """Resolve a lookup from the UUID cache or playerdb.co, dropping it from the lookup cache if it fails."""
+        try:
+            cached = _uuid_cache.get(key)
+            if cached is not None:
+                return cls(*cached)
+            player = await cls._fetch_player(query)
+        except BaseException:
+            _lookup_cache.pop(key, None)  # don't remember failures, the next call should try again
+            raise
+        if player is None:
+            _lookup_cache.pop(key, None)  # the name may be claimed later
+        else:
+            _uuid_cache.put(key, player.uuid, player.mc_username)
+        return player
+
+    @classmethod
+    async def lookup_players(cls, queries: list[str]) -> list[Union['Player', None]]:
+        """Look up several players at once over the shared session.
+
+        Args:
+            queries (list[str]): The Minecraft usernames or UUIDs to look up.
+
+        Returns:
+            list[Player | None]: The result of each lookup, in the same order as the queries.
+        """
+        return await asyncio.gather(*[cls.lookup_player(query) for query in queries])
+
+    @classmethod
+    async def _get_session(cls) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use.
+
+        Returns:
+            aiohttp.ClientSession: The shared session.
+        """
+        if cls._session is None or cls._session.closed:
+            cls._session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=10, ttl_dns_cache=300),
+                                                 timeout=aiohttp.ClientTimeout(total=LOOKUP_TIMEOUT))
+        return cls._session
+
+    @classmethod
+    async def close_session(cls) -> None:
+        """Close the shared HTTP session, if one was created."""
+        if cls._session is not None and not cls._session.closed:
+            await cls._session.close()
+        cls._session = None
+
+    @classmethod
+    async def _fetch_player(cls, query: str) -> Union['Player', None]:
+        session = await cls._get_session()
+        async with session.get(f'https://playerdb.co/api/player/minecraft/{query}') as resp:
+            if resp.status == 204:
+                return None
+            data = _loads(await resp.read())
+            if not data.get('success'):
+                return None
+
+            # https://playerdb.co/api/player/minecraft/EmberIgnited
+            uuid = UUID(data['data']['player']['id'])
+            username = data['data']['player']['username']
+
+            return cls(uuid, username)
 
 
 def create_profile_embed(user: discord.User, player: Player, embed: discord.Embed) -> discord.Embed:
@@ -85,132 +270,185 @@ def create_profile_embed(user: discord.User, player: Player, embed: discord.Embe
     return embed
 
 
-async def mc_whitelist(player: Player, rcon_config: Rcon):
+async def _ensure_team(player: Player, team: str, color: str, rcon_config: Rcon,
+                       current_teams: dict[str, frozenset[str]] | None = None):
+    """
+    Move a player onto a team in Minecraft, skipping commands that wouldn't change anything.
+
+    Args:
+        player (Player): The player to move.
+        team (str): The team to move the player onto.
+        color (str): The color of the team, used if the team has to be created.
+        rcon_config (Rcon): The Rcon configuration to use.
+        current_teams (dict[str, frozenset[str]], optional): Members of each team, if already known.
+    """
+    if current_teams is not None:
+        if player.mc_username in current_teams.get(team, ()):
+            return
+        if not any(player.mc_username in members for members in current_teams.values()):
+            await team_join(team, player.mc_username, rcon_config, color)  # not on a team, nothing to leave
+            return
     await team_leave(player.mc_username, rcon_config)
-    await team_join("Whitelisted", player.mc_username, rcon_config, "green")
-    await whitelist_add(player.mc_username, rcon_config)
-    player.is_whitelisted = True
+    await team_join(team, player.mc_username, rcon_config, color)
+
+
+async def _ensure_whitelisted(player: Player, rcon_config: Rcon, whitelist: frozenset[str] | None = None):
+    if whitelist is None:
+        whitelist = await get_whitelist_players(rcon_config)
+    if player.mc_username not in whitelist:
+        await whitelist_add(player.mc_username, rcon_config)
+
+
+async def mc_whitelist(player: Player, rcon_config: Rcon, current_teams: dict[str, frozenset[str]] | None = None,
+                       force: bool = False):
+    if player.is_whitelisted and not force:
+        return
+    await asyncio.gather(_ensure_team(player, "Whitelisted", "green", rcon_config, current_teams),
+                         whitelist_add(player.mc_username, rcon_config))
+    player.flags |= FLAG_WHITELISTED
 
 
-async def mc_unwhitelist(player: Player, rcon_config: Rcon):
+async def mc_unwhitelist(player: Player, rcon_config: Rcon, force: bool = False):
     """
     Remove a player from the whitelist in Minecraft.
 
     Args:
         player (Player): The player to remove.
         rcon_config (Rcon): The Rcon configuration to use.
+        force (bool, optional): Apply the change even if the player data says it is already in place.
 
     Raises:
         ValueError: If the player is not found.
     """
-    await team_leave(player.mc_username, rcon_config)
-    await whitelist_remove(player.mc_username, rcon_config)
-    player.is_whitelisted = False
+    if not player.is_whitelisted and not force:
+        return
+    await asyncio.gather(team_leave(player.mc_username, rcon_config),
+                         whitelist_remove(player.mc_username, rcon_config))
+    player.flags &= ~FLAG_WHITELISTED
 
 
-async def mc_trust(player: Player, rcon_config: Rcon):
+async def mc_trust(player: Player, rcon_config: Rcon, current_teams: dict[str, frozenset[str]] | None = None,
+                   whitelist: frozenset[str] | None = None, force: bool = False):
     """
     Add a player to the trusted team in Minecraft.
 
     Args:
         player (Player): The player to add.
         rcon_config (Rcon): The Rcon configuration to use.
+        current_teams (dict[str, frozenset[str]], optional): Members of each team, if already known.
+        whitelist (frozenset[str], optional): The whitelisted players, if already known.
+        force (bool, optional): Apply the change even if the player data says it is already in place.
 
     Raises:
         ValueError: If the player is not found.
     """
-    if player.mc_username not in await get_whitelist_players(rcon_config):
-        await whitelist_add(player.mc_username, rcon_config)
-    await team_leave(player.mc_username, rcon_config)
-    await team_join("Trusted", player.mc_username, rcon_config, "blue")
-    player.is_trusted = True
+    if player.is_trusted and not force:
+        return
+    await asyncio.gather(_ensure_whitelisted(player, rcon_config, whitelist),
+                         _ensure_team(player, "Trusted", "blue", rcon_config, current_teams))
+    player.flags |= FLAG_TRUSTED
 
 
-async def mc_untrust(player: Player, rcon_config: Rcon):
+async def mc_untrust(player: Player, rcon_config: Rcon, force: bool = False):
     """
     Remove a player from the trusted team in Minecraft.
 
     Args:
         player (Player): The player to remove.
         rcon_config (Rcon): The Rcon configuration to use.
+        force (bool, optional): Apply the change even if the player data says it is already in place.
 
     Raises:
         ValueError: If the player is not found.
     """
-    await team_leave(player.mc_username, rcon_config)
-    await team_join("Whitelisted", player.mc_username, rcon_config, "green")
-    player.is_trusted = False
+    if not player.is_trusted and not force:
+        return
+    await _ensure_team(player, "Whitelisted", "green", rcon_config)
+    player.flags &= ~FLAG_TRUSTED
 
 
-async def mc_staff(player: Player, rcon_config: Rcon):
+async def mc_staff(player: Player, rcon_config: Rcon, current_teams: dict[str, frozenset[str]] | None = None,
+                   whitelist: frozenset[str] | None = None, force: bool = False):
     """
     Add a player to the staff team in Minecraft.
 
     Args:
         player (Player): The player to add.
         rcon_config (Rcon): The Rcon configuration to use.
+        current_teams (dict[str, frozenset[str]], optional): Members of each team, if already known.
+        whitelist (frozenset[str], optional): The whitelisted players, if already known.
+        force (bool, optional): Apply the change even if the player data says it is already in place.
 
     Raises:
         ValueError: If the player is not found.
     """
-    if player.mc_username not in await get_whitelist_players(rcon_config):
-        await whitelist_add(player.mc_username, rcon_config)
-    await team_leave(player.mc_username, rcon_config)
-    await team_join("Staff", player.mc_username, rcon_config, "dark_purple")
-    await op(player.mc_username, rcon_config)
-    player.is_staff = True
+    if player.is_staff and not force:
+        return
+    await asyncio.gather(_ensure_whitelisted(player, rcon_config, whitelist),
+                         _ensure_team(player, "Staff", "dark_purple", rcon_config, current_teams),
+                         op(player.mc_username, rcon_config))
+    player.flags |= FLAG_STAFF
 
 
-async def mc_unstaff(player: Player, rcon_config: Rcon):
+async def mc_unstaff(player: Player, rcon_config: Rcon, force: bool = False):
     """
     Remove a player from the staff team in Minecraft.
 
     Args:
         player (Player): The player to remove.
         rcon_config (Rcon): The Rcon configuration to use.
+        force (bool, optional): Apply the change even if the player data says it is already in place.
 
     Raises:
         ValueError: If the player is not found.
     """
-    await team_leave(player.mc_username, rcon_config)
-    await team_join("Trusted", player.mc_username, rcon_config, "blue")
-    await deop(player.mc_username, rcon_config)
-    player.is_staff = False
+    if not player.is_staff and not force:
+        return
+    await asyncio.gather(_ensure_team(player, "Trusted", "blue", rcon_config),
+                         deop(player.mc_username, rcon_config))
+    player.flags &= ~FLAG_STAFF
 
 
-async def mc_owner(player: Player, rcon_config: Rcon):
+async def mc_owner(player: Player, rcon_config: Rcon, current_teams: dict[str, frozenset[str]] | None = None,
+                   whitelist: frozenset[str] | None = None, force: bool = False):
     """
     Add a player to the owner team in Minecraft.
 
     Args:
         player (Player): The player to add.
         rcon_config (Rcon): The Rcon configuration to use.
+        current_teams (dict[str, frozenset[str]], optional): Members of each team, if already known.
+        whitelist (frozenset[str], optional): The whitelisted players, if already known.
+        force (bool, optional): Apply the change even if the player data says it is already in place.
 
     Raises:
         ValueError: If the player is not found."""
-    if player.mc_username not in await get_whitelist_players(rcon_config):
-        await whitelist_add(player.mc_username, rcon_config)
-    await team_join("Owner", player.mc_username, rcon_config, "light_purple")
-    await whitelist_add(player.mc_username, rcon_config)
-    await op(player.mc_username, rcon_config)
-    player.is_owner = True
-    player.is_whitelisted = True
+    if player.is_owner and not force:
+        return
+    commands = [_ensure_whitelisted(player, rcon_config, whitelist), op(player.mc_username, rcon_config)]
+    if current_teams is None or player.mc_username not in current_teams.get("Owner", ()):
+        commands.append(team_join("Owner", player.mc_username, rcon_config, "light_purple"))
+    await asyncio.gather(*commands)
+    player.flags |= FLAG_OWNER | FLAG_WHITELISTED
 
 
-async def mc_unowner(player: Player, rcon_config: Rcon):
+async def mc_unowner(player: Player, rcon_config: Rcon, force: bool = False):
     """
     Remove a player from the owner team in Minecraft.
 
     Args:
         player (Player): The player to remove.
         rcon_config (Rcon): The Rcon configuration to use.
+        force (bool, optional): Apply the change even if the player data says it is already in place.
 
     Raises:
         ValueError: If the player is not found.
     """
-    await deop(player.mc_username, rcon_config)
-    await mc_trust(player, rcon_config)
-    player.is_owner = False
+    if not player.is_owner and not force:
+        return
+    await asyncio.gather(deop(player.mc_username, rcon_config),
+                         mc_trust(player, rcon_config, force=True))
+    player.flags &= ~FLAG_OWNER
 
 
 class PlayerData:
@@ -222,23 +460,63 @@ class PlayerData:
     Args:
         file_path (Path): The file path to the player data file.
         rcon_config (Rcon): The Rcon configuration to use.
+        fsync (bool): Whether to fsync the player data file on save. Defaults to True.
 
     Attributes:
         file_path (Path): The file path to the player data file.
-        _playerdata (dict[int, dict[str, str]]): The player data.
+        uuid_cache_path (Path): The file path to the cache of player lookups, next to the player data file.
+        fsync (bool): Whether to fsync the player data file on save.
+        _playerdata (dict[int, Player]): The player data, keyed by Discord ID.
+        _mc_index (dict[str, int]): The Discord ID of each player, keyed by Minecraft username.
+        _by_uuid (dict[UUID, int]): The Discord ID of each player, keyed by Minecraft UUID.
         rcon_config (Rcon): The Rcon configuration to use.
     """
-    def __init__(self, file_path: Path, rcon_config: Rcon):
+    def __init__(self, file_path: Path, rcon_config: Rcon, fsync: bool = True):
         self.file_path = file_path
-        if not file_path.exists():
-            file_path.touch()
-            file_path.write_text('{}')
-        self._playerdata: dict[int, dict[str, str]] = json.loads(file_path.read_text())
+        self.uuid_cache_path = file_path.with_suffix('.uuidcache')
+        self.fsync = fsync
+        self._playerdata: dict[int, Player] = {}
+        self._mc_index: dict[str, int] = {}
+        self._by_uuid: dict[UUID, int] = {}
         self.rcon_config = rcon_config
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+        self._save_lock = asyncio.Lock()
+        # changes to the same player are serialized, changes to different players can run concurrently
+        self._locks: defaultdict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._dirty = False
+        self._save_handle: asyncio.TimerHandle | None = None
+        self._save_task: asyncio.Task | None = None
 
     def __str__(self):
         return str(self._playerdata)
 
+    async def load(self):
+        """
+        Load the player data from the file, if it hasn't been loaded already.
+
+        The synchronous getters only see loaded data, so this should be awaited before the bot handles events.
+        """
+        if self._loaded:
+            return
+        async with self._load_lock:
+            if self._loaded:  # loaded by another task while we waited
+                return
+            if self.file_path.exists():
+                raw_playerdata: dict[str, dict[str, str]] = await asyncio.to_thread(_read_json_file, self.file_path)
+            else:
+                raw_playerdata = {}
+            if self.uuid_cache_path.exists():
+                try:
+                    _uuid_cache.load(await asyncio.to_thread(self.uuid_cache_path.read_bytes))
+                except (ValueError, IndexError, TypeError) as e:  # only a cache, start over rather than fail
+                    logger.warning("Ignoring unreadable player lookup cache: %s", e)
+            # JSON keys are always strings, the Discord IDs are converted here and in save() only
+            self._playerdata = {int(k): Player.from_dict(v) for k, v in raw_playerdata.items()}
+            self._mc_index = {v.mc_username: k for k, v in self._playerdata.items()}
+            self._by_uuid = {v.uuid: k for k, v in self._playerdata.items()}
+            self._loaded = True
+
     async def sync(self, guild: discord.Guild) -> list[Player]:
         """
         Sync the player data with the Minecraft Server.
@@ -249,265 +527,390 @@ class PlayerData:
         Returns:
             list[Player]: The players that were synced.
         """
-        synced_players = []
-        for discord_id, player in self._playerdata.items():
-            player = Player.from_dict(player)
-            owners_team = await get_team_players("Owner", self.rcon_config)
-            staff_team = await get_team_players("Staff", self.rcon_config)
-            trusted_team = await get_team_players("Trusted", self.rcon_config)
-            whitelisted_team = await get_team_players("Whitelisted", self.rcon_config)
-
-            if discord.utils.get(guild.members, id=int(discord_id)) is None:
-                logger.info(f"Player {player.mc_username} not found in the server, removing from player data.")
-                synced_players.append(player)
-                await self.remove(int(discord_id))
-                continue
-
-            # applies the correct team to the player based on their highest role in the Discord server
-            if player.is_owner and player.mc_username not in owners_team:
-                await mc_owner(player, self.rcon_config)
-                synced_players.append(player)
-                continue
-            elif player.is_owner and player.mc_username in owners_team:
-                continue  # owner is already in the owner team, no action needed
-
-            if player.is_staff and player.mc_username not in staff_team:
-                await mc_staff(player, self.rcon_config)
-                synced_players.append(player)
-                continue
-            elif player.is_staff and player.mc_username in staff_team:
-                continue
-
-            if player.is_trusted and player.mc_username not in trusted_team:
-                await mc_trust(player, self.rcon_config)
-                synced_players.append(player)
-                continue
-            elif player.is_trusted and player.mc_username in trusted_team:
-                continue
-
-            if player.is_whitelisted and player.mc_username not in whitelisted_team:
-                await mc_whitelist(player, self.rcon_config)
-                synced_players.append(player)
-                continue
-            elif player.is_whitelisted and player.mc_username in whitelisted_team:
-                continue
-        return synced_players
+        await self.load()
+        teams = {
+            "Owner": frozenset(await get_team_players("Owner", self.rcon_config)),
+            "Staff": frozenset(await get_team_players("Staff", self.rcon_config)),
+            "Trusted": frozenset(await get_team_players("Trusted", self.rcon_config)),
+            "Whitelisted": frozenset(await get_team_players("Whitelisted", self.rcon_config)),
+        }
+        whitelist = frozenset(await get_whitelist_players(self.rcon_config))
+        member_by_id = {member.id: member for member in guild.members}
+        sem = asyncio.Semaphore(8)  # bound concurrent RCON traffic
+
+        async def _sync_one(discord_id: int, player: Player, teams: dict[str, frozenset[str]]) -> Player | None:
+            async with sem:
+                if discord_id not in member_by_id:
+                    logger.info(f"Player {player.mc_username} not found in the server, removing from player data.")
+                    await self.remove(discord_id)
+                    return player
+                async with self._locks[discord_id]:
+                    return await self._sync_teams(player, teams, whitelist)
+
+        # snapshot the items, departed members are removed from the player data while syncing
+        items = list(self._playerdata.items())
+        results = await asyncio.gather(*[_sync_one(discord_id, player, teams) for discord_id, player in items],
+                                       return_exceptions=True)  # one failed player shouldn't abandon the rest
+        synced = []
+        for (discord_id, player), result in zip(items, results):
+            if isinstance(result, BaseException):
+                logger.error("Failed to sync player %s (%s): %s", player.mc_username, discord_id, result,
+                             exc_info=result)
+            elif result is not None:
+                synced.append(result)
+        return synced
+
+    async def _sync_teams(self, player: Player, teams: dict[str, frozenset[str]],
+                          whitelist: frozenset[str]) -> Player | None:
+        """Apply the correct team to the player based on their highest role. Returns the player if it changed."""
+        if player.is_owner:
+            if player.mc_username in teams["Owner"]:
+                return None  # owner is already in the owner team, no action needed
+            await mc_owner(player, self.rcon_config, teams, whitelist, force=True)
+            return player
+
+        if player.is_staff:
+            if player.mc_username in teams["Staff"]:
+                return None
+            await mc_staff(player, self.rcon_config, teams, whitelist, force=True)
+            return player
+
+        if player.is_trusted:
+            if player.mc_username in teams["Trusted"]:
+                return None
+            await mc_trust(player, self.rcon_config, teams, whitelist, force=True)
+            return player
+
+        if player.is_whitelisted and player.mc_username not in teams["Whitelisted"]:
+            await mc_whitelist(player, self.rcon_config, teams, force=True)
+            return player
+        return None
+
+    def _schedule_save(self):
+        """Mark the player data as changed and write it shortly, so a burst of changes is only written once."""
+        self._dirty = True
+        if self._save_handle is None:
+            self._save_handle = asyncio.get_running_loop().call_later(SAVE_DELAY, self._start_flush)
+
+    def _start_flush(self):
+        self._save_handle = None
+        self._save_task = asyncio.create_task(self._flush_in_background())
+
+    async def _flush_in_background(self):
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("Failed to save player data.")
+
+    async def flush(self):
+        """
+        Write any pending changes to the file now. Should be awaited before shutting down.
+        """
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+            self._save_handle = None
+        task = self._save_task
+        if task is not None and not task.done() and task is not asyncio.current_task():
+            # a background save already cleared _dirty, wait for its write to land before reporting it flushed
+            await asyncio.shield(task)
+        if not self._dirty:
+            return
+        self._dirty = False
+        try:
+            await self.save()
+        except Exception:
+            self._dirty = True  # keep the changes pending for the next flush
+            raise
 
     async def save(self):
         """
         Save the player data to the file.
 
-        Raises:
-            FileNotFoundError: If the file is not found.
+        The data is written to a temporary file which then replaces the original, so a crash mid-write can't
+        leave a truncated file behind.
         """
-        async with aiofiles.open(self.file_path, 'w+') as f:
-            await f.write(json.dumps(self._playerdata, indent=4))
+        await self.load()
+        data = _dumps({str(k): p.as_dict() for k, p in self._playerdata.items()})
+        uuid_cache = _uuid_cache.dump() if _uuid_cache.dirty else None
+        async with self._save_lock:  # concurrent saves would share the temporary file
+            await asyncio.to_thread(self._write_file, self.file_path, data)
+            if uuid_cache is not None:
+                await asyncio.to_thread(self._write_file, self.uuid_cache_path, uuid_cache)
+
+    def _write_file(self, path: Path, data: bytes):
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            if self.fsync:  # durable across power loss, not just crashes
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
 
     async def add_owner(self, discord_id: int):
         """
         Add a player to the owner team.
 
         Args:
-            discord_id (str): The Discord ID of the player to add.
+            discord_id (int): The Discord ID of the player to add.
 
         Raises:
             ValueError: If the player is not found.
         """
-        player = self.get(discord_id)
-        if player is None:
-            raise ValueError("Player not found.")
-        await mc_owner(player, self.rcon_config)
-        self.set(discord_id, player)
-        await self.save()
+        await self.load()
+        async with self._locks[discord_id]:
+            player = self.get(discord_id)
+            if player is None:
+                raise ValueError("Player not found.")
+            await mc_owner(player, self.rcon_config)
+            self.set(discord_id, player)
+            self._schedule_save()
 
     async def remove_owner(self, discord_id: int):
         """
         Remove a player from the owner team.
 
         Args:
-            discord_id (str): The Discord ID of the player to remove.
+            discord_id (int): The Discord ID of the player to remove.
 
         Raises:
             ValueError: If the player is not found.
         """
+        await self.load()
+        async with self._locks[discord_id]:
+            await self._do_remove_owner(discord_id)
+            self._schedule_save()
+
+    async def _do_remove_owner(self, discord_id: int):
         player = self.get(discord_id)
         if player is None:
             raise ValueError("Player not found.")
         await mc_unowner(player, self.rcon_config)
         self.set(discord_id, player)
-        await self.save()
 
     async def add_staff(self, discord_id: int):
         """
         Add a player to the staff team.
 
         Args:
-            discord_id (str): The Discord ID of the player to add.
+            discord_id (int): The Discord ID of the player to add.
 
         Raises:
             ValueError: If the player is not found."""
-        player = self.get(discord_id)
-        if player is None:
-            raise ValueError("Player not found.")
-        await mc_staff(player, self.rcon_config)
-        self.set(discord_id, player)
-        await self.save()
+        await self.load()
+        async with self._locks[discord_id]:
+            player = self.get(discord_id)
+            if player is None:
+                raise ValueError("Player not found.")
+            await mc_staff(player, self.rcon_config)
+            self.set(discord_id, player)
+            self._schedule_save()
 
     async def remove_staff(self, discord_id: int):
         """
         Remove a player from the staff team.
 
         Args:
-            discord_id (str): The Discord ID of the player to remove.
+            discord_id (int): The Discord ID of the player to remove.
 
         Raises:
             ValueError: If the player is not found.
         """
+        await self.load()
+        async with self._locks[discord_id]:
+            await self._do_remove_staff(discord_id)
+            self._schedule_save()
+
+    async def _do_remove_staff(self, discord_id: int):
         player = self.get(discord_id)
         if player is None:
             raise ValueError("Player not found.")
         await mc_unstaff(player, self.rcon_config)
-        player.is_staff = False
+        player.flags &= ~FLAG_STAFF
         self.set(discord_id, player)
-        await self.save()
 
     async def add(self, discord_id: int, query: str):
         """
         Add a player to the player data. This will create a profile for the player.
 
         Args:
-            discord_id (str): The Discord ID of the player.
+            discord_id (int): The Discord ID of the player.
             query (str): The Minecraft username of the player.
 
         Raises:
             ValueError: If the player is not found.
         """
-        player = await Player.lookup_player(query)
-        if player is None:
-            raise ValueError("Player not found.")
-        self.set(discord_id, player)
-        await self.save()
+        await self.load()
+        async with self._locks[discord_id]:
+            player = await Player.lookup_player(query)
+            if player is None:
+                raise ValueError("Player not found.")
+            self.set(discord_id, player)
+            self._schedule_save()
 
     async def whitelist(self, discord_id: int):
         """
         Add a player to the whitelist. This will add them to the whitelist on the server and Discord.
 
         Args:
-            discord_id (str): The Discord ID of the player.
+            discord_id (int): The Discord ID of the player.
 
         Raises:
             ValueError: If the player is not found in the player data.
         """
-        player = self.get(discord_id)
-        if player is None:
-            raise ValueError("Player not found in player data.")
-        await mc_whitelist(player, self.rcon_config)
-        self.set(discord_id, player)
-        await self.save()
+        await self.load()
+        async with self._locks[discord_id]:
+            player = self.get(discord_id)
+            if player is None:
+                raise ValueError("Player not found in player data.")
+            await mc_whitelist(player, self.rcon_config)
+            self.set(discord_id, player)
+            self._schedule_save()
 
     async def unwhitelist(self, discord_id: int):
         """
         Unwhitelist a player. This will remove them from the whitelist on the server and Discord.
 
         Args:
-            discord_id (str): The Discord ID of the player.
+            discord_id (int): The Discord ID of the player.
 
         Raises:
             ValueError: If the player is not found in the player data.
         """
+        await self.load()
+        async with self._locks[discord_id]:
+            await self._do_unwhitelist(discord_id)
+            self._schedule_save()
+
+    async def _do_unwhitelist(self, discord_id: int):
         player = self.get(discord_id)
         if player is None:
             raise ValueError("Player not found in player data.")
         await mc_unwhitelist(player, self.rcon_config)
         self.set(discord_id, player)
-        await self.save()
 
     async def trust(self, discord_id: int):
         """
         Trust a player. This will add them to the trusted team on the server and Discord.
 
         Args:
-            discord_id (str): The Discord ID of the player.
+            discord_id (int): The Discord ID of the player.
 
         Raises:
             ValueError: If the player is not found in the player data.
         """
-        player = self.get(discord_id)
-        if player is None:
-            raise ValueError("Player not found in player data.")
-        await mc_trust(player, self.rcon_config)
-        player.is_trusted = True
-        self.set(discord_id, player)
+        await self.load()
+        async with self._locks[discord_id]:
+            player = self.get(discord_id)
+            if player is None:
+                raise ValueError("Player not found in player data.")
+            await mc_trust(player, self.rcon_config)
+            player.flags |= FLAG_TRUSTED
+            self.set(discord_id, player)
 
-        await self.save()
+            self._schedule_save()
 
     async def untrust(self, discord_id: int):
         """
         Untrust a player. This will remove them from the trusted team on the server and Discord.
 
         Args:
-            discord_id (str): The Discord ID of the player.
+            discord_id (int): The Discord ID of the player.
 
         Raises:
             ValueError: If the player is not found in the player data.
         """
+        await self.load()
+        async with self._locks[discord_id]:
+            await self._do_untrust(discord_id)
+            self._schedule_save()
+
+    async def _do_untrust(self, discord_id: int):
         player = self.get(discord_id)
         if player is None:
             raise ValueError("Player not found in player data.")
         await mc_untrust(player, self.rcon_config)
         self.set(discord_id, player)
 
-        await self.save()
-
     async def remove(self, discord_id: int):
         """
         Remove a player from the player data.
 
         Args:
-            discord_id (str): The Discord ID of the player to remove.
+            discord_id (int): The Discord ID of the player to remove.
 
         Raises:
             ValueError: If the player is not found in the player data.
         """
-        player = self.get(discord_id)
-        if player is None:
-            raise ValueError("Player not found in player data.")
-        if player.is_owner:
-            await self.remove_owner(discord_id)
-        if player.is_staff:
-            await self.remove_staff(discord_id)
-        if player.is_trusted:
-            await self.untrust(discord_id)
-        if player.is_whitelisted:
-            await self.unwhitelist(discord_id)
-        player = Player.from_dict(self._playerdata.pop(str(discord_id)))
-        await self.save()
+        await self.load()
+        async with self._locks[discord_id]:
+            player = self.get(discord_id)
+            if player is None:
+                raise ValueError("Player not found in player data.")
+            # the player data is only written once, after every role has been removed
+            if player.is_owner:
+                await self._do_remove_owner(discord_id)
+            if player.is_staff:
+                await self._do_remove_staff(discord_id)
+            if player.is_trusted:
+                await self._do_untrust(discord_id)
+            if player.is_whitelisted:
+                await self._do_unwhitelist(discord_id)
+            if self._mc_index.get(player.mc_username) == discord_id:  # the name may be linked to another user too
+                del self._mc_index[player.mc_username]
+            if self._by_uuid.get(player.uuid) == discord_id:
+                del self._by_uuid[player.uuid]
+            self._playerdata.pop(discord_id)
+            self._schedule_save()
 
     def get_mc(self, mc_username: str) -> Player | None:
-        for player in self._playerdata.values():
-            if player['mc_username'] == mc_username:
-                return Player.from_dict(player)
-        return None
+        discord_id = self._mc_index.get(mc_username)
+        return self.get(discord_id) if discord_id is not None else None
+
+    def get_by_uuid(self, uuid: UUID) -> Player | None:
+        discord_id = self._by_uuid.get(uuid)
+        return self.get(discord_id) if discord_id is not None else None
 
     def get(self, discord_id: int) -> Player | None:
         """
         Get a player object from the player data. If the player is not found, return None.
 
         Args:
-            discord_id (str): The Discord ID of the player.
+            discord_id (int): The Discord ID of the player.
 
         Raises:
             ValueError: If the player is not found in the player data.
 
         Returns:
             Player | None: The player object if found, otherwise None."""
-        player = Player.from_dict(self._playerdata.get(str(discord_id)))
+        player = self._playerdata.get(discord_id)
         if player is None:
             raise ValueError("Player not found in player data.")
         return player
 
-    def get_all(self) -> list[tuple[int, Player]]:
-        return [(int(k), Player.from_dict(v)) for k, v in self._playerdata.items()]
+    def get_flag(self, discord_id: int, key: str) -> bool:
+        """
+        Check a single role flag of a player without raising if the player is unknown.
+
+        Args:
+            discord_id (int): The Discord ID of the player.
+            key (str): The flag to check, one of "is_trusted", "is_whitelisted", "is_owner" or "is_staff".
+
+        Returns:
+            bool: Whether the player exists and has the flag set.
+        """
+        player = self._playerdata.get(discord_id)
+        return player is not None and bool(player.flags & _FLAGS[key])
+
+    def get_all(self) -> Iterator[tuple[int, Player]]:
+        return iter(self._playerdata.items())
 
     def set(self, discord_id: int, player: Player):
-        self._playerdata[str(discord_id)] = player.as_dict()
+        previous = self._playerdata.get(discord_id)
+        if (previous is not None and previous.mc_username != player.mc_username
+                and self._mc_index.get(previous.mc_username) == discord_id):
+            del self._mc_index[previous.mc_username]  # the account was relinked to a new username
+        if previous is not None and previous.uuid != player.uuid and self._by_uuid.get(previous.uuid) == discord_id:
+            del self._by_uuid[previous.uuid]
+        self._playerdata[discord_id] = player
+        self._mc_index[player.mc_username] = discord_id
+        self._by_uuid[player.uuid] = discord_id
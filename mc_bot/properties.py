@@ -1,5 +1,7 @@
 from pathlib import Path
 
+_BOOLEANS = {"true": True, "false": False}
+
 
 class Properties:
     """Read Java's properties files and return a dictionary with the key-value pairs."""
@@ -9,22 +11,19 @@ class Properties:
         self.load()
 
     def load(self) -> None:
-        with open(self.path) as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                key, value = line.split("=", 1)
-                if value.lower() == "true":
-                    value = True
-                elif value.lower() == "false":
-                    value = False
-                if isinstance(value, str) and value.isdigit():
-                    value = int(value)
-                if isinstance(value, str):
-                    self.properties[key.strip()] = value.strip()
-                else:
-                    self.properties[key.strip()] = value
+        properties = {}
+        for line in self.path.read_text().splitlines():
+            line = line.strip()
+            if not line or line[0] == "#":
+                continue
+            key, _, value = line.partition("=")
+            value = value.strip()
+            digits = value[1:] if value.startswith("-") else value  # at most one sign, "--5" stays a string
+            if digits.isdecimal():  # isdigit() also accepts characters like "²" that int() rejects
+                properties[key.strip()] = int(value)
+            else:
+                properties[key.strip()] = _BOOLEANS.get(value.lower(), value)
+        self.properties = properties
 
     def save(self) -> None:
         with open(self.path, "w") as f:
@@ -2,7 +2,7 @@ import logging
 
 import discord
 
-logger = logging.getLogger(__file__)
+logger = logging.getLogger(__name__)
 
 
 class ConfirmView(discord.ui.View):
@@ -14,6 +14,9 @@ class ConfirmView(discord.ui.View):
         timeout (int): The timeout in seconds before the prompt is automatically canceled.
         confirmed (bool): Whether the prompt has been confirmed.
     """
+    # timeout is a property of discord.ui.View and must stay out of the slots
+    __slots__ = ("confirm", "cancel", "confirm_callback", "cancel_callback", "embed", "message", "_is_disabled")
+
     def __init__(self, embed: discord.Embed, timeout: int = 30, confirm_callback=None, cancel_callback=None):
         super().__init__()
         self.confirm = discord.ui.Button(style=discord.ButtonStyle.success, label="Confirm")
@@ -22,14 +25,22 @@ class ConfirmView(discord.ui.View):
         self.cancel_callback = cancel_callback
         self.timeout = timeout
         self.embed = embed
+        self._is_disabled = False  # set once the buttons have been disabled, so the message is only edited once
 
     async def on_timeout(self) -> None:
+        if self._is_disabled:
+            return
+        self._is_disabled = True
         self.cancel.disabled = True
         self.cancel.label = "Timed Out"
         self.confirm.disabled = True
         await self.message.edit(view=self)
+        self.stop()
 
     async def disable(self) -> None:
+        if self._is_disabled:
+            return
+        self._is_disabled = True
         for item in self.children:
             item.disabled = True
         await self.message.edit(view=self)
@@ -1,9 +1,8 @@
 import logging
-from math import ceil
 
 import discord
 
-logger = logging.getLogger(__file__)
+logger = logging.getLogger(__name__)
 
 
 class PageView(discord.ui.View):
@@ -18,30 +17,48 @@ class PageView(discord.ui.View):
         page_index (int): The current page index.
         items (list[str]): The list of items to paginate.
     """
+    # discord.ui.View keeps a __dict__ for the decorated buttons, so these only cover the view's own state
+    __slots__ = ("embed", "page_size", "page_count", "_footer_suffix", "_page_index", "_start", "items", "_formatted",
+                 "_page_cache", "_prev_btn", "_next_btn", "message")
+
     def __init__(self, items: list[str], embed: discord.Embed):
         super().__init__()
         self.embed = embed
         self.page_size = 10
-        self.page_count = max(ceil(len(items) / self.page_size), 1)  # ensure at least one page
+        self.page_count = max((len(items) + self.page_size - 1) // self.page_size, 1)  # ensure at least one page
+        self._footer_suffix = f"/{self.page_count}"
         self.page_index = 0
         self.items = items
+        self._formatted = [f"- {item}" for item in items]
+        self._page_cache: dict[int, str] = {}  # rendered descriptions by page index, cleared by set_items
 
         if self.page_count > 1:
-            self.embed.set_footer(text=f"Page {self.page_index + 1}/{self.page_count}")
+            self.embed.set_footer(text=f"Page {self.page_index + 1}{self._footer_suffix}")
 
+        # discord.py replaces the decorated callbacks with their Button instances once the view is built
+        self._prev_btn: discord.ui.Button = self.previous_page
+        self._next_btn: discord.ui.Button = self.next_page
         if self.page_count == 1:
-            for child in self.children:
-                if isinstance(child, discord.ui.Button):
-                    self.remove_item(child)  # remove the buttons for one-page views
+            self.remove_item(self._prev_btn)  # remove the buttons for one-page views
+            self.remove_item(self._next_btn)
+        self._sync_button_state()
 
     @discord.ui.button(label="Previous", style=discord.ButtonStyle.primary)
     async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
+        previous_index = self.page_index
         self.page_index -= 1
+        if self.page_index == previous_index:  # already on the boundary page, nothing to redraw
+            await interaction.response.defer()
+            return
         await self.update_message(interaction)
 
     @discord.ui.button(label="Next", style=discord.ButtonStyle.primary)
     async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
+        previous_index = self.page_index
         self.page_index += 1
+        if self.page_index == previous_index:  # already on the boundary page, nothing to redraw
+            await interaction.response.defer()
+            return
         await self.update_message(interaction)
 
     @property
@@ -50,14 +67,8 @@ class PageView(discord.ui.View):
 
     @page_index.setter
     def page_index(self, value: int) -> None:
-        adjusted_page_count = self.page_count - 1
-        # 0-based index, adjust for comparison
-        if value < 1:
-            self._page_index = 0
-        elif value > adjusted_page_count:
-            self._page_index = self.page_count - 1
-        else:
-            self._page_index = value
+        self._page_index = max(0, min(value, self.page_count - 1))
+        self._start = self._page_index * self.page_size  # offset of the first item on the current page
 
     async def on_timeout(self) -> None:
         for child in self.children:
@@ -65,18 +76,46 @@ class PageView(discord.ui.View):
         self.embed.description = "This interaction has timed out."
         await self.message.edit(view=self)  # this should be set immediately after sending the interaction response.
 
+    def _sync_button_state(self) -> None:
+        """Disable the buttons that would move past the first or last page."""
+        self._prev_btn.disabled = self.page_index == 0
+        self._next_btn.disabled = self.page_index >= self.page_count - 1
+
     async def update_message(self, interaction: discord.Interaction) -> None:
         try:
+            self._sync_button_state()
             await self.build_embed()
-            self.embed.set_footer(text=f"Page {self.page_index + 1}/{self.page_count}")
+            self.embed.set_footer(text=f"Page {self.page_index + 1}{self._footer_suffix}")
             await interaction.response.edit_message(embed=self.embed, view=self)
         except Exception as e:
             logger.error("Failed to update message: %s", e)
 
     async def build_embed(self) -> discord.Embed:
         """Build the embed with the items for the current page."""
-        self.embed.description = ""
-        items = self.items[self.page_index*self.page_size:(self.page_index*self.page_size)+self.page_size]
-        for item in items:
-            self.embed.description += f"\n- {item}"
+        description = self._page_cache.get(self.page_index)
+        if description is None:
+            description = self._page_cache[self.page_index] = "\n".join(
+                self._formatted[self._start:self._start + self.page_size])
+        self.embed.description = description
         return self.embed
+
+    def set_items(self, items: list[str]) -> None:
+        """Replace the paginated items, keeping the current page where possible.
+
+        Args:
+            items (list[str]): The new list of items to paginate.
+        """
+        self.items = items
+        self._formatted = [f"- {item}" for item in items]
+        self._page_cache.clear()
+        self.page_count = max((len(items) + self.page_size - 1) // self.page_size, 1)
+        self._footer_suffix = f"/{self.page_count}"
+        self.page_index = self.page_index  # re-clamp to the new page count
+        buttons_shown = self._prev_btn in self.children
+        if self.page_count > 1 and not buttons_shown:  # one-page views drop the buttons in __init__
+            self.add_item(self._prev_btn)
+            self.add_item(self._next_btn)
+        elif self.page_count == 1 and buttons_shown:
+            self.remove_item(self._prev_btn)
+            self.remove_item(self._next_btn)
+        self._sync_button_state()
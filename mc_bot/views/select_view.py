@@ -1,23 +1,20 @@
-from math import ceil
+import asyncio
 import logging
 
 import discord
 
-logger = logging.getLogger(__file__)
+logger = logging.getLogger(__name__)
 
 
 class Dropdown(discord.ui.Select):
-    def __init__(self, *, options: list = None,
+    __slots__ = ("embed", "selected_handler")
+
+    def __init__(self, *, options: list[discord.SelectOption],
                  placeholder: str = None, selected_handler=None, max_values: int = 1,
                  embed: discord.Embed):
-        if options is None:
-            options = []
         self.embed = embed
         self.selected_handler = selected_handler
 
-        if len(options) < max_values:  # Discord requires max_values to be less than or equal to the number of options
-            max_values = len(options)
-
         super().__init__(placeholder=placeholder, min_values=1, max_values=max_values, options=options)
 
     async def callback(self, interaction: discord.Interaction) -> None:
@@ -25,45 +22,84 @@ class Dropdown(discord.ui.Select):
 
 
 class SelectView(discord.ui.View):
+    # discord.ui.View keeps a __dict__ for the decorated buttons, so these only cover the view's own state
+    __slots__ = ("embed", "page_size", "page_count", "_footer_suffix", "_page_index", "_start", "items", "_update_lock",
+                 "_rendered_page", "_pairs", "max_values", "_prev_btn", "_next_btn", "dropdown", "message")
+
     #  TODO: Create a way to paginate the items and expose the full backup count even beyond Discord's initial limits.
     # if a selection_handler is provided, a dropdown will be added to the view.
-    def __init__(self, items: dict[str, str], embed: discord.Embed, selected_handler: callable,
+    def __init__(self, items: list[tuple[str, str]] | dict[str, str], embed: discord.Embed, selected_handler: callable,
                  multi_select: bool = False):
         super().__init__()
         self.embed = embed
         self.page_size = 10
-        self.page_count = max(ceil(len(items) / self.page_size), 1)  # ensure at least one page
+        self.page_count = max((len(items) + self.page_size - 1) // self.page_size, 1)  # ensure at least one page
+        self._footer_suffix = f"/{self.page_count}"
         self.page_index = 0
         self.items = items
+        self._update_lock = asyncio.Lock()
+        self._rendered_page = 0  # the page the message currently shows
+        # (label, value) pairs, sliceable; a list is used as-is so create() does not copy it twice
+        self._pairs = list(items.items()) if isinstance(items, dict) else items
         if multi_select:
             self.max_values = self.page_size
         else:
             self.max_values = 1
 
         if self.page_count > 1:
-            self.embed.set_footer(text=f"Page {self.page_index + 1}/{self.page_count}")
+            self.embed.set_footer(text=f"Page {self.page_index + 1}{self._footer_suffix}")
 
+        # discord.py replaces the decorated callbacks with their Button instances once the view is built
+        self._prev_btn: discord.ui.Button = self.previous_page
+        self._next_btn: discord.ui.Button = self.next_page
         if self.page_count == 1:
-            for item in self.children:
-                if isinstance(item, discord.ui.Button):
-                    self.remove_item(item)  # remove the buttons for one-page views
-
-        all_options = []
-        for item in self.items:
-            all_options.append(discord.SelectOption(label=item, value=items[item]))
-        self.add_item(Dropdown(
-            options=all_options[self.page_index*self.page_size:(self.page_index*self.page_size)+self.page_size],
+            self.remove_item(self._prev_btn)  # remove the buttons for one-page views
+            self.remove_item(self._next_btn)
+        self._sync_button_state()
+
+        options = self._page_options()
+        # Discord requires max_values to be less than or equal to the number of options
+        self.dropdown = Dropdown(
+            options=options,
             selected_handler=selected_handler, embed=embed,
-            max_values=self.max_values))
+            max_values=min(self.max_values, len(options)))
+        self.add_item(self.dropdown)
+
+    @classmethod
+    async def create(cls, items: list[tuple[str, str]] | dict[str, str], embed: discord.Embed,
+                     selected_handler: callable, multi_select: bool = False) -> 'SelectView':
+        """Build a view, turning the items into (label, value) pairs off the event loop.
+
+        Use this instead of the constructor for very large catalogues.
+
+        Args:
+            items (list[tuple[str, str]] | dict[str, str]): The labels and values to select from.
+            embed (discord.Embed): The embed shown alongside the view.
+            selected_handler (callable): Called with the interaction, the selected values and the embed.
+            multi_select (bool, optional): Whether a whole page can be selected at once. Defaults to False.
+
+        Returns:
+            SelectView: The constructed view.
+        """
+        pairs = await asyncio.to_thread(list, items.items() if isinstance(items, dict) else items)
+        return cls(pairs, embed, selected_handler, multi_select=multi_select)
 
     @discord.ui.button(label="Previous", style=discord.ButtonStyle.primary)
     async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
+        previous_index = self.page_index
         self.page_index -= 1
+        if self.page_index == previous_index:  # already on the boundary page, nothing to redraw
+            await interaction.response.defer()
+            return
         await self.update_message(interaction)
 
     @discord.ui.button(label="Next", style=discord.ButtonStyle.primary)
     async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
+        previous_index = self.page_index
         self.page_index += 1
+        if self.page_index == previous_index:  # already on the boundary page, nothing to redraw
+            await interaction.response.defer()
+            return
         await self.update_message(interaction)
 
     @property
@@ -72,14 +108,8 @@ class SelectView(discord.ui.View):
 
     @page_index.setter
     def page_index(self, value: int) -> None:
-        adjusted_page_count = self.page_count - 1
-        # 0-based index, adjust for comparison
-        if value < 1:
-            self._page_index = 0
-        elif value > adjusted_page_count:
-            self._page_index = self.page_count - 1
-        else:
-            self._page_index = value
+        self._page_index = max(0, min(value, self.page_count - 1))
+        self._start = self._page_index * self.page_size  # offset of the first item on the current page
 
     async def on_timeout(self) -> None:
         for item in self.children:
@@ -87,24 +117,34 @@ class SelectView(discord.ui.View):
         self.embed.description = "This interaction has timed out."
         await self.message.edit(view=self)  # this should be set immediately after sending the interaction response.
 
+    def _sync_button_state(self) -> None:
+        """Disable the buttons that would move past the first or last page."""
+        self._prev_btn.disabled = self.page_index == 0
+        self._next_btn.disabled = self.page_index >= self.page_count - 1
+
     async def update_message(self, interaction: discord.Interaction) -> None:
         try:
-            all_options = []
-            for item in self.items:
-                all_options.append(discord.SelectOption(label=item, value=self.items[item]))
-            options = all_options[self.page_index*self.page_size:(self.page_index*self.page_size)+self.page_size]
-            self.embed.set_footer(text=f"Page {self.page_index + 1}/{self.page_count}")
-            for item in self.children:
-                if isinstance(item, Dropdown):
-                    selected_handler = item.selected_handler
-                    self.remove_item(item)
-            self.add_item(Dropdown(
-                options=options, selected_handler=selected_handler, embed=self.embed,
-                max_values=self.page_size))
-            await interaction.response.edit_message(embed=self.embed, view=self)
+            async with self._update_lock:
+                if self.page_index == self._rendered_page:  # a concurrent flip already drew this page
+                    await interaction.response.defer()
+                    return
+                rendered = self.page_index  # a queued flip may move page_index while the edit is in flight
+                self._sync_button_state()
+                options = self._page_options()
+                self.embed.set_footer(text=f"Page {self.page_index + 1}{self._footer_suffix}")
+                # the last page may hold fewer options than max_values allows
+                self.dropdown.options = options
+                self.dropdown.max_values = min(self.max_values, len(options))
+                await interaction.response.edit_message(embed=self.embed, view=self)
+                self._rendered_page = rendered
         except Exception as e:
             logger.error("Failed to update message: %s", e)
 
+    def _page_options(self) -> list[discord.SelectOption]:
+        """Build the select options for the current page only."""
+        return [discord.SelectOption(label=label, value=value)
+                for label, value in self._pairs[self._start:self._start + self.page_size]]
+
     async def disable(self) -> None:
         for item in self.children:
             item.disabled = True